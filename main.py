@@ -1,12 +1,20 @@
 import sys
 import os
 import json
+import logging
 import subprocess
 import re
-from datetime import datetime
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from operator import itemgetter
 
 DEBUG = False
 
+SIGNAL_HISTORY_LEN = 30     # dBm samples kept (and graphed) per BSSID
+HISTORY_STALE_SCANS = 10    # drop a BSSID's history after this many scans unseen
+RESCAN_INTERVAL = 30        # seconds between hardware rescans the scanner requests
+
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(APP_DIR, "config.json")
 
@@ -22,22 +30,37 @@ DEFAULT_CONFIG = {
 }
 
 
-def debug(*args, **kwargs):
-    if DEBUG:
-        print(f"[DEBUG] [{datetime.now().strftime('%H:%M:%S')}]", *args, **kwargs)
+log = logging.getLogger("nzscan")
+scan_log = logging.getLogger("nzscan.scanner")
+
+
+def debug(msg, *args):
+    """Log at DEBUG; %-style args are only formatted when debug output is on."""
+    log.debug(msg, *args)
+
+
+# Last parsed config, reused until the file's mtime changes
+_CFG_CACHE = {"mtime": 0, "data": None}
 
 
 def load_config():
-    if os.path.exists(CONFIG_PATH):
-        try:
-            with open(CONFIG_PATH, "r") as f:
-                cfg = json.load(f)
-            for k, v in DEFAULT_CONFIG.items():
-                if k not in cfg:
-                    cfg[k] = v
-            return cfg
-        except Exception as e:
-            debug(f"Error loading config: {e}")
+    try:
+        mtime = os.stat(CONFIG_PATH).st_mtime
+    except OSError:
+        return dict(DEFAULT_CONFIG)
+    if _CFG_CACHE["data"] is not None and _CFG_CACHE["mtime"] == mtime:
+        return dict(_CFG_CACHE["data"])
+    try:
+        with open(CONFIG_PATH, "r") as f:
+            cfg = json.load(f)
+        for k, v in DEFAULT_CONFIG.items():
+            if k not in cfg:
+                cfg[k] = v
+        _CFG_CACHE["mtime"] = mtime
+        _CFG_CACHE["data"] = cfg
+        return dict(cfg)
+    except Exception as e:
+        debug("Error loading config: %s", e)
     return dict(DEFAULT_CONFIG)
 
 
@@ -46,9 +69,11 @@ def save_config(cfg):
         os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
         with open(CONFIG_PATH, "w") as f:
             json.dump(cfg, f, indent=4)
-        debug(f"Config saved to {CONFIG_PATH}")
+        _CFG_CACHE["mtime"] = os.stat(CONFIG_PATH).st_mtime
+        _CFG_CACHE["data"] = dict(cfg)
+        debug("Config saved to %s", CONFIG_PATH)
     except Exception as e:
-        debug(f"Error saving config: {e}")
+        debug("Error saving config: %s", e)
 
 
 from PySide6.QtWidgets import (
@@ -57,8 +82,9 @@ from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
+    QStyledItemDelegate,
     QHeaderView,
     QSystemTrayIcon,
     QMenu,
@@ -79,7 +105,10 @@ from PySide6.QtCore import (
     QThread,
     Signal,
     Qt,
+    QAbstractTableModel,
+    QModelIndex,
     QTimer,
+    QElapsedTimer,
     QPointF,
     QRectF,
 )
@@ -99,66 +128,109 @@ from PySide6.QtGui import (
 )
 from PySide6.QtCore import QUrl
 
+# libnm (via PyGObject) talks to NetworkManager over D-Bus directly; without it
+# the scanner falls back to spawning nmcli and parsing its terse output.
+try:
+    import gi
+    gi.require_version("NM", "1.0")
+    from gi.repository import GLib, NM
+    _AP_FLAGS = getattr(NM, "80211ApFlags")
+    _AP_SEC = getattr(NM, "80211ApSecurityFlags")
+except (ImportError, ValueError, AttributeError):
+    NM = None
+
 from themes import THEME, apply_theme, get_theme_names, current_theme_name
 
 
 # ── Data model ────────────────────────────────────────────────────────────────
 
+# Signal is reported as a 0-100 percentage, so everything derived from it is a
+# table lookup instead of per-AP arithmetic and comparison chains.
+_SIGNAL_DBM = tuple(int(s / 2 - 100) for s in range(101))
+_SIGNAL_QUALITY = tuple(
+    "Excellent" if s >= 75 else "Good" if s >= 50 else "Fair" if s >= 25 else "Weak"
+    for s in range(101)
+)
+_SIGNAL_BARS = tuple(
+    4 if s >= 80 else 3 if s >= 60 else 2 if s >= 40 else 1 if s >= 20 else 0
+    for s in range(101)
+)
+
+# Colour buckets index SIGNAL_COLOR_KEYS: 0 excellent .. 3 weak
+SIGNAL_COLOR_KEYS = ("signal_excellent", "signal_good", "signal_fair", "signal_weak")
+_SIGNAL_THRESHOLDS = (75, 50, 25)
+_DBM_THRESHOLDS = (-50, -70, -80)
+
+
+def _bucket(value, thresholds):
+    hi, mid, lo = thresholds
+    return 0 if value >= hi else 1 if value >= mid else 2 if value >= lo else 3
+
+
+_SIGNAL_BUCKET = tuple(_bucket(s, _SIGNAL_THRESHOLDS) for s in range(101))
+_DBM_BUCKET = tuple(_bucket(d, _DBM_THRESHOLDS) for d in _SIGNAL_DBM)
+
+
 class WifiNetwork:
-    def __init__(self, ssid, bssid, signal, channel, freq, security, signal_bar=0):
-        self.ssid = ssid
-        self.bssid = bssid
+    def __init__(self, ssid, bssid, signal, signal_int, channel, freq, security,
+                 last_seen=None):
+        # Interned: the BSSID keys the scanner cache, the history and the table rows
+        self.bssid = sys.intern(bssid)
+        self.last_seen = last_seen or datetime.now()
+        self.update(ssid, signal, signal_int, channel, freq, security)
+
+    def update(self, ssid, signal, signal_int, channel, freq, security):
+        """Store the scanned fields and derive dBm, quality, bars and band from them once.
+
+        `signal_int` is the backend's parsed percentage, -1 if it reported none.
+        """
+        self.ssid = sys.intern(ssid)
         self.signal = signal
+        self.signal_int = signal_int
         self.channel = channel
         self.frequency = freq
-        self.security = security
-        self.signal_bar = signal_bar
-        self.last_seen = datetime.now()
-
-    @property
-    def signal_dbm(self):
-        try:
-            return int((int(self.signal) / 2) - 100) if self.signal else -100
-        except Exception as e:
-            debug(f"[WifiNetwork] signal_dbm error: {e}")
-            return -100
-
-    @property
-    def signal_quality(self):
-        try:
-            s = int(self.signal)
-            if s >= 75:
-                return "Excellent"
-            elif s >= 50:
-                return "Good"
-            elif s >= 25:
-                return "Fair"
-            else:
-                return "Weak"
-        except Exception as e:
-            debug(f"[WifiNetwork] signal_quality error: {e}")
-            return "Unknown"
-
-    @property
-    def band(self):
-        try:
-            freq = int(self.frequency.replace("MHz", ""))
-            return "5 GHz" if freq > 5000 else "2.4 GHz"
-        except Exception as e:
-            debug(f"[WifiNetwork] band error: {e}")
-            return "Unknown"
+        self.security = sys.intern(security)
+
+        self.channel_int = int(channel) if channel and channel.isdigit() else 0
+        self.search_text = f"{ssid} {self.bssid} {security}".lower()
+        mhz = freq[:-3].strip() if freq.endswith("MHz") else ""
+        self.freq_mhz = int(mhz) if mhz.isdigit() else 0
+
+        sig = min(self.signal_int, 100)
+        if sig < 0:
+            self.signal_dbm = -100
+            self.signal_quality = "Unknown"
+            self.signal_bar = 0
+            self.signal_bucket = self.dbm_bucket = 3
+        else:
+            self.signal_dbm = _SIGNAL_DBM[sig]
+            self.signal_bar = _SIGNAL_BARS[sig]
+            self.signal_quality = _SIGNAL_QUALITY[sig]
+            self.signal_bucket = _SIGNAL_BUCKET[sig]
+            self.dbm_bucket = _DBM_BUCKET[sig]
+
+        mhz = self.freq_mhz
+        if not mhz:
+            self.band = "Unknown"
+        else:
+            self.band = ("6 GHz" if mhz >= 5925 else
+                         "5 GHz" if mhz > 5000 else "2.4 GHz")
 
 
 # ── Scanner thread ─────────────────────────────────────────────────────────────
 
 class WifiScannerThread(QThread):
-    networks_found = Signal(list)
+    networks_found = Signal(list, str)            # networks, connected BSSID
+    networks_changed = Signal(list, list, list)   # added, updated, removed
 
     def __init__(self):
         super().__init__()
         self.adapter = ""
         self.running = True
         self.scan_interval = 3000
+        self._by_bssid: dict[str, WifiNetwork] = {}
+        self._last_rescan = float("-inf")
+        self._rescan_proc = None
 
     def set_adapter(self, adapter):
         self.adapter = adapter
@@ -167,82 +239,202 @@ class WifiScannerThread(QThread):
         self.scan_interval = interval
 
     def run(self):
+        client = self._connect_nm()
         while self.running:
             if self.adapter and self.adapter not in ["No adapters", "p2p-dev-wlan0"]:
-                debug(f"[WiFi Scanner] Scanning with adapter: {self.adapter}")
+                scan_log.debug("[WiFi Scanner] Scanning with adapter: %s", self.adapter)
                 try:
-                    cmd = [
-                        "nmcli", "-t",
-                        "-f", "BSSID,SIGNAL,CHAN,FREQ,SECURITY,SSID",
-                        "device", "wifi", "list",
-                        "ifname", self.adapter,
-                    ]
-                    debug(f"[WiFi Scanner] Running: {' '.join(cmd)}")
-                    output = subprocess.check_output(
-                        cmd, text=True, stderr=subprocess.DEVNULL
-                    )
-                    lines = output.strip().split("\n")
-                    debug(f"[WiFi Scanner] Raw output: {len(lines)} lines")
-
-                    networks = []
-                    for line in lines:
-                        if not line:
-                            continue
-                        # Unescape BSSID colons before splitting on ':'
-                        unescaped = line.replace("\\:", "\x00")
-                        parts = unescaped.split(":")
-                        if parts:
-                            parts[0] = parts[0].replace("\x00", ":")
-
-                        debug(f"[WiFi Scanner] Line: {line[:50]} -> parts: {len(parts)}")
-
-                        if len(parts) >= 5:
-                            bssid   = parts[0]
-                            signal  = parts[1]
-                            chan    = parts[2]
-                            freq    = parts[3]
-                            sec     = parts[4] if len(parts) > 4 else ""
-                            ssid    = ":".join(parts[5:]) if len(parts) > 5 else ""
-
-                            debug(f"[WiFi Scanner] Parsed: SSID={ssid[:30]!r} signal={signal} chan={chan} freq={freq} sec={sec!r}")
-
-                            signal_bar = self._signal_bar(signal)
-                            networks.append(
-                                WifiNetwork(ssid, bssid, signal, chan, freq, sec, signal_bar)
-                            )
-                        else:
-                            debug(f"[WiFi Scanner] Skipped (too few parts): {line[:50]!r}")
-
-                    debug(f"[WiFi Scanner] Parsed {len(networks)} networks, sorting...")
-                    networks.sort(
-                        key=lambda x: int(x.signal) if x.signal.isdigit() else 0,
-                        reverse=True,
-                    )
-                    debug(f"[WiFi Scanner] Emitting {len(networks)} networks")
-                    self.networks_found.emit(networks)
+                    now = datetime.now()   # one timestamp for every AP in this scan
+                    if client is not None:
+                        rows, connected = self._scan_dbus(client)
+                    else:
+                        rows, connected = self._scan_nmcli()
+                    scan_log.debug("[WiFi Scanner] Parsed %d networks, sorting...", len(rows))
+                    # Strongest first; the cache keeps this order for networks_found
+                    rows.sort(key=itemgetter(3), reverse=True)
+                    added, updated, removed = self._merge(rows, now)
+
+                    networks = list(self._by_bssid.values())
+                    scan_log.debug("[WiFi Scanner] Emitting %d networks (+%d ~%d -%d)",
+                                   len(networks), len(added), len(updated), len(removed))
+                    self.networks_found.emit(networks, connected)
+                    # A static environment (the common case) leaves the table alone
+                    if added or updated or removed:
+                        self.networks_changed.emit(added, updated, removed)
 
                 except subprocess.CalledProcessError as e:
-                    debug(f"[WiFi Scanner] nmcli error (exit {e.returncode}): {e.stderr}")
+                    scan_log.debug("[WiFi Scanner] nmcli error (exit %s): %s", e.returncode, e.stderr)
                 except FileNotFoundError:
-                    debug("[WiFi Scanner] nmcli not found — install NetworkManager")
+                    scan_log.debug("[WiFi Scanner] nmcli not found — install NetworkManager")
                 except Exception as e:
-                    debug(f"[WiFi Scanner] Unexpected error: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    scan_log.exception("[WiFi Scanner] Unexpected error: %s", e)
 
             self.msleep(self.scan_interval)
 
-    def _signal_bar(self, signal):
+        if client is not None:
+            client.get_main_context().pop_thread_default()
+
+    def _merge(self, rows, now):
+        """Fold parsed rows into the BSSID cache, mutating known networks in place."""
+        seen = {}
+        added, updated = [], []
+        for ssid, bssid, signal, sig_int, chan, freq, sec in rows:
+            net = self._by_bssid.get(bssid)
+            if net is None:
+                net = WifiNetwork(ssid, bssid, signal, sig_int, chan, freq, sec, now)
+                added.append(net)
+            else:
+                if (net.ssid, net.signal, net.channel, net.frequency, net.security) != \
+                        (ssid, signal, chan, freq, sec):
+                    net.update(ssid, signal, sig_int, chan, freq, sec)
+                    updated.append(net)
+                net.last_seen = now
+            seen[net.bssid] = net
+        removed = [net for bssid, net in self._by_bssid.items() if bssid not in seen]
+        self._by_bssid = seen
+        return added, updated, removed
+
+    # ── D-Bus backend ───────────────────────────────────────────────────────────
+
+    def _connect_nm(self):
+        """Return an NM.Client bound to this thread, or None to use nmcli."""
+        if NM is None:
+            scan_log.debug("[WiFi Scanner] libnm not available, using nmcli")
+            return None
+        context = GLib.MainContext.new()
+        context.push_thread_default()
         try:
-            s = int(signal)
-            if s >= 80: return 4
-            if s >= 60: return 3
-            if s >= 40: return 2
-            if s >= 20: return 1
-            return 0
-        except Exception as e:
-            debug(f"[WiFi Scanner] _signal_bar error: {e}")
-            return 0
+            return NM.Client.new(None)
+        except GLib.Error as e:
+            scan_log.debug("[WiFi Scanner] NetworkManager D-Bus error: %s, using nmcli", e.message)
+            context.pop_thread_default()
+            return None
+
+    def _scan_dbus(self, client):
+        # Let libnm apply the D-Bus property updates queued since the last tick
+        context = client.get_main_context()
+        while context.iteration(False):
+            pass
+
+        device = client.get_device_by_iface(self.adapter)
+        if not isinstance(device, NM.DeviceWifi):
+            scan_log.debug("[WiFi Scanner] %s is not a WiFi device", self.adapter)
+            return [], ""
+
+        # Same policy as `nmcli device wifi list`: rescan if results are stale
+        last_scan = device.get_last_scan()
+        if last_scan < 0 or NM.utils_get_timestamp_msec() - last_scan > RESCAN_INTERVAL * 1000:
+            device.request_scan_async(None, None, None)
+
+        rows = []
+        for ap in device.get_access_points():
+            raw_ssid = ap.get_ssid()
+            ssid = NM.utils_ssid_to_utf8(raw_ssid.get_data()) if raw_ssid else ""
+            freq = ap.get_frequency()
+            strength = ap.get_strength()
+            rows.append((
+                ssid,
+                ap.get_bssid() or "",
+                str(strength),
+                strength,
+                str(NM.utils_wifi_freq_to_channel(freq)),
+                f"{freq} MHz",
+                self._ap_security(ap),
+            ))
+        active = device.get_active_access_point()
+        connected = (active.get_bssid() or "") if active is not None else ""
+        return rows, connected
+
+    @staticmethod
+    def _ap_security(ap):
+        """Build the same SECURITY string nmcli prints for an access point."""
+        flags = ap.get_flags()
+        wpa = ap.get_wpa_flags()
+        rsn = ap.get_rsn_flags()
+        parts = []
+        if flags & _AP_FLAGS.PRIVACY and not wpa and not rsn:
+            parts.append("WEP")
+        if wpa:
+            parts.append("WPA1")
+        if rsn & (_AP_SEC.KEY_MGMT_PSK | _AP_SEC.KEY_MGMT_802_1X):
+            parts.append("WPA2")
+        if rsn & _AP_SEC.KEY_MGMT_SAE:
+            parts.append("WPA3")
+        if rsn & _AP_SEC.KEY_MGMT_OWE:
+            parts.append("OWE")
+        if (wpa | rsn) & _AP_SEC.KEY_MGMT_802_1X:
+            parts.append("802.1X")
+        return " ".join(parts)
+
+    # ── nmcli backend ───────────────────────────────────────────────────────────
+
+    def _scan_nmcli(self):
+        """Return the parsed rows and the BSSID of the active access point."""
+        self._request_rescan()
+        # --rescan no: read NetworkManager's current AP list without scanning again.
+        # --escape no: see _parse_nmcli_line() for why no unescaping is needed.
+        cmd = [
+            "nmcli", "-t", "--escape", "no",
+            "-f", "BSSID,ACTIVE,SIGNAL,CHAN,FREQ,SECURITY,SSID",
+            "device", "wifi", "list",
+            "ifname", self.adapter,
+            "--rescan", "no",
+        ]
+        scan_log.debug("[WiFi Scanner] Running: %s", " ".join(cmd))
+
+        # Parse lines as nmcli flushes them rather than decoding one big blob
+        verbose = scan_log.isEnabledFor(logging.DEBUG)
+        rows = []
+        connected = ""
+        n_lines = 0
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc:
+            for raw in proc.stdout:
+                n_lines += 1
+                line = raw.rstrip(b"\n").decode("utf-8", "replace")
+                row = self._parse_nmcli_line(line, verbose) if line else None
+                if row is not None:
+                    rows.append(row)
+                    if line.startswith("yes:", 18):
+                        connected = row[1]
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        scan_log.debug("[WiFi Scanner] Raw output: %d lines", n_lines)
+        return rows, connected
+
+    def _request_rescan(self):
+        """Kick off a hardware scan every RESCAN_INTERVAL seconds without waiting."""
+        now = time.monotonic()
+        if now - self._last_rescan < RESCAN_INTERVAL:
+            return
+        if self._rescan_proc is not None and self._rescan_proc.poll() is None:
+            return
+        self._last_rescan = now
+        self._rescan_proc = subprocess.Popen(
+            ["nmcli", "device", "wifi", "rescan", "ifname", self.adapter],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        scan_log.debug("[WiFi Scanner] Requested rescan on %s", self.adapter)
+
+    @staticmethod
+    def _parse_nmcli_line(line, verbose):
+        # BSSID:ACTIVE:SIGNAL:CHAN:FREQ:SECURITY:SSID, unescaped. The BSSID is
+        # always 17 chars and only the trailing SSID may contain ':', so one slice
+        # and one bounded split tokenise the line in a single C-level pass.
+        fields = line[18:].split(":", 5) if line[17:18] == ":" else ()
+        if len(fields) < 6:
+            if verbose:
+                scan_log.debug("[WiFi Scanner] Skipped (too few parts): %r", line[:50])
+            return None
+
+        bssid = line[:17]
+        _active, signal, chan, freq, sec, ssid = fields
+        sig_int = int(signal) if signal.isdigit() else -1
+
+        if verbose:
+            scan_log.debug("[WiFi Scanner] Parsed: SSID=%r signal=%s chan=%s freq=%s sec=%r",
+                           ssid[:30], signal, chan, freq, sec)
+
+        return (ssid, bssid, signal, sig_int, chan, freq, sec)
 
     def stop(self):
         self.running = False
@@ -251,60 +443,132 @@ class WifiScannerThread(QThread):
 
 # ── Widgets ────────────────────────────────────────────────────────────────────
 
-class SignalStrengthWidget(QWidget):
-    def __init__(self, bars=0, parent=None):
-        super().__init__(parent)
-        self.bars = bars
-        self.setMinimumSize(40, 20)
-
-    def set_bars(self, bars):
-        self.bars = bars
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
+# Colours, pens, brushes and fonts for the custom-painted widgets. Built on first
+# paint and cleared by the main window whenever the theme changes.
+_paint_cache = {}
+
+
+def _paint_objects():
+    if not _paint_cache:
+        accent = QColor(THEME["accent_primary"])
+        bold = QFont(); bold.setBold(True)
+        grad_top = QColor(accent); grad_top.setAlpha(80)
+        grad_bot = QColor(accent); grad_bot.setAlpha(10)
+        _paint_cache.update({
+            "bg":           QColor(THEME["bg_tertiary"]),
+            "text":         QColor(THEME["text_secondary"]),
+            "muted":        QColor(THEME["text_muted"]),
+            "grid_pen":     QPen(QColor(THEME["border"]), 1, Qt.DashLine),
+            "curve_pen":    QPen(accent, 2),
+            "accent_brush": QBrush(accent),
+            "muted_brush":  QBrush(QColor(THEME["text_muted"])),
+            "bar_brushes":  [QBrush(QColor(THEME[k])) for k in
+                             ("signal_weak", "signal_weak", "signal_fair", "signal_good")],
+            "grad_top":     grad_top,
+            "grad_bot":     grad_bot,
+            "font":         QFont("Segoe UI", 9),
+            "font_large":   QFont("Segoe UI", 12),
+            "bar_pixmaps":  {},
+            # WifiTableModel
+            "sig_colors":   [QColor(THEME[k]) for k in SIGNAL_COLOR_KEYS],
+            "connected_bg": QColor(accent.red(), accent.green(), accent.blue(), 25),
+            "bold_font":    bold,
+        })
+    return _paint_cache
+
+
+def _paint_signal_bars(painter, w, h, bars):
+    paint = _paint_objects()
+    gap = 2
+    bar_w = (w - 3 * gap) / 4   # four bars and three gaps fill exactly `w`
+    bar_brushes = paint["bar_brushes"]
+    painter.setPen(Qt.NoPen)
+    for i in range(4):
+        x = i * (bar_w + gap)
+        bar_h = h * (i + 1) / 4
+        painter.setBrush(bar_brushes[i] if i < bars else paint["muted_brush"])
+        painter.drawRect(QRectF(x, h - bar_h, bar_w, bar_h))
+
+
+def _signal_bars_pixmap(bars, w, h, dpr):
+    """Bars for one level pre-rendered at one size; dropped with the paint cache."""
+    pixmaps = _paint_objects()["bar_pixmaps"]
+    key = (bars, w, h, dpr)
+    pixmap = pixmaps.get(key)
+    if pixmap is None:
+        if len(pixmaps) >= 64:   # column resizes produce a new size per step
+            pixmaps.clear()
+        pixmap = QPixmap(int(w * dpr), int(h * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
-        w = self.width() / 4
-        h = self.height()
-        colors = [THEME["signal_weak"], THEME["signal_weak"],
-                  THEME["signal_fair"], THEME["signal_good"]]
-        for i in range(4):
-            x = i * (w + 2)
-            bar_h = h * (i + 1) / 4
-            if i < self.bars:
-                painter.setBrush(QBrush(QColor(colors[i])))
-            else:
-                painter.setBrush(QBrush(QColor(THEME["text_muted"])))
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(int(x), int(h - bar_h), int(w) - 2, int(bar_h))
+        _paint_signal_bars(painter, w, h, bars)
+        painter.end()
+        pixmaps[key] = pixmap
+    return pixmap
 
 
 class SignalGraphWidget(QWidget):
-    def __init__(self, signal_history=None, parent=None):
+    def __init__(self, signal_history=None, parent=None, animations=True):
         super().__init__(parent)
         self.signal_history = signal_history or []
         self.setMinimumHeight(180)
         self.setMinimumWidth(300)
-        self._scroll_offset = 0.0
-        self._scroll_speed = 0.02
+        self._animations = animations
+        self._scroll_offset = 0.0 if animations else 1.0
+        self._scroll_speed = 0.02   # offset per 33 ms frame, scaled by the real frame time
+        # Cached by _build_paths(); _path_size is the widget size they were built for
+        self._path_size = None
+        self._spacing = 0.0
+        self._points = []
+        self._grid_xs = []
+        self._curve_path = None
+        self._fill_path = None
+        # Runs only while a scroll is in progress and the widget is shown
         self._anim_timer = QTimer(self)
         self._anim_timer.setInterval(33)
         self._anim_timer.timeout.connect(self._tick)
-        self._anim_timer.start()
+        self._frame_clock = QElapsedTimer()
+
+    def _start_animation(self):
+        if (self._animations and self.isVisible()
+                and len(self.signal_history) >= 2 and self._scroll_offset < 1.0):
+            self._frame_clock.start()
+            self._anim_timer.start()
 
     def _tick(self):
-        if len(self.signal_history) >= 2:
-            self._scroll_offset += self._scroll_speed
-            if self._scroll_offset > 1.0:
-                self._scroll_offset = 1.0
-            self.update()
+        if not self.isVisible():
+            self._anim_timer.stop()
+            return
+        if self.visibleRegion().isEmpty():
+            # Nobody can watch the scroll; settle at the resting position
+            self._scroll_offset = 1.0
+        else:
+            frames = self._frame_clock.restart() / self._anim_timer.interval()
+            self._scroll_offset += self._scroll_speed * frames
+        if self._scroll_offset >= 1.0:
+            self._scroll_offset = 1.0
+            self._anim_timer.stop()
+        self.update()
 
     def set_history(self, history):
         self.signal_history = history
-        self._scroll_offset = 0.0
+        self._path_size = None
+        self._scroll_offset = 0.0 if self._animations else 1.0
+        self._start_animation()
         self.update()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._start_animation()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._anim_timer.stop()
+
     def paintEvent(self, event):
+        paint = _paint_objects()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         w = self.width()
@@ -313,32 +577,65 @@ class SignalGraphWidget(QWidget):
         graph_w = w - left_pad - right_pad
         graph_h = h - top_pad - bottom_pad
 
-        painter.fillRect(0, 0, w, h, QColor(THEME["bg_tertiary"]))
+        painter.fillRect(0, 0, w, h, paint["bg"])
         painter.setClipRect(QRectF(0, 0, w, h))
 
-        font = QPainter.font(painter) if False else None
-        from PySide6.QtGui import QFont as _QFont
-        painter.setFont(_QFont("Segoe UI", 9))
+        painter.setFont(paint["font"])
         for label, frac in [("0", 0), ("-30", 0.25), ("-60", 0.5), ("-90", 0.75), ("-100", 1.0)]:
             y = top_pad + graph_h * frac
-            painter.setPen(QPen(QColor(THEME["border"]), 1, Qt.DashLine))
+            painter.setPen(paint["grid_pen"])
             painter.drawLine(int(left_pad), int(y), int(w - right_pad), int(y))
-            painter.setPen(QColor(THEME["text_secondary"]))
+            painter.setPen(paint["text"])
             painter.drawText(2, int(y) + 4, label)
 
         if len(self.signal_history) < 2:
-            painter.setPen(QColor(THEME["text_muted"]))
-            painter.setFont(_QFont("Segoe UI", 12))
+            painter.setPen(paint["muted"])
+            painter.setFont(paint["font_large"])
             painter.drawText(QRectF(left_pad, top_pad, graph_w, graph_h),
                              Qt.AlignCenter, "No data")
             painter.end()
             return
 
-        max_points = 30
-        history = list(self.signal_history[-max_points:])
+        # Curve geometry only changes with new data or a resize; scrolling is a translate
+        if self._path_size != (w, h):
+            self._build_paths(left_pad, top_pad, graph_w, graph_h)
+            self._path_size = (w, h)
+
+        scroll_px = self._scroll_offset * self._spacing
+        right_edge = left_pad + graph_w
+
+        painter.setClipRect(QRectF(left_pad, 0, graph_w, h))
+
+        painter.setPen(paint["grid_pen"])
+        for x in self._grid_xs:
+            px = x - scroll_px
+            if left_pad <= px <= right_edge:
+                painter.drawLine(int(px), int(top_pad), int(px), int(top_pad + graph_h))
+
+        painter.translate(-scroll_px, 0)
+
+        gradient = QLinearGradient(0, top_pad, 0, top_pad + graph_h)
+        gradient.setColorAt(0, paint["grad_top"])
+        gradient.setColorAt(1, paint["grad_bot"])
+        painter.fillPath(self._fill_path, QBrush(gradient))
+
+        painter.setPen(paint["curve_pen"])
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(self._curve_path)
+
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(paint["accent_brush"])
+        for p in self._points[-5:]:
+            painter.drawEllipse(p, 3, 3)
+
+        painter.end()
+
+    def _build_paths(self, left_pad, top_pad, graph_w, graph_h):
+        """Lay out the unscrolled curve, its fill and the vertical grid lines."""
+        max_points = SIGNAL_HISTORY_LEN
+        history = self.signal_history
         n = len(history)
         spacing = graph_w / (max_points - 1) if max_points > 1 else graph_w
-        scroll_px = self._scroll_offset * spacing
 
         def dbm_to_y(dbm):
             clamped = max(-100, min(0, dbm))
@@ -347,19 +644,9 @@ class SignalGraphWidget(QWidget):
         points = []
         right_edge = left_pad + graph_w
         for i, dbm in enumerate(history):
-            x = right_edge - spacing * (n - 1 - i) - scroll_px
+            x = right_edge - spacing * (n - 1 - i)
             points.append(QPointF(x, dbm_to_y(dbm)))
 
-        painter.setClipRect(QRectF(left_pad, 0, graph_w, h))
-
-        pen = QPen(QColor(THEME["border"]), 1, Qt.DashLine)
-        painter.setPen(pen)
-        for i in range(0, len(points), 5):
-            if i > 0:
-                px = points[i].x()
-                if left_pad <= px <= right_edge:
-                    painter.drawLine(int(px), int(top_pad), int(px), int(top_pad + graph_h))
-
         curve_path = QPainterPath()
         curve_path.moveTo(points[0])
         for i in range(1, len(points)):
@@ -372,23 +659,161 @@ class SignalGraphWidget(QWidget):
         fill_path.lineTo(points[0].x(), top_pad + graph_h)
         fill_path.closeSubpath()
 
-        gradient = QLinearGradient(0, top_pad, 0, top_pad + graph_h)
-        color_top = QColor(THEME["accent_primary"]); color_top.setAlpha(80)
-        color_bot = QColor(THEME["accent_primary"]); color_bot.setAlpha(10)
-        gradient.setColorAt(0, color_top)
-        gradient.setColorAt(1, color_bot)
-        painter.fillPath(fill_path, QBrush(gradient))
+        self._spacing = spacing
+        self._points = points
+        self._grid_xs = [points[i].x() for i in range(5, n, 5)]
+        self._curve_path = curve_path
+        self._fill_path = fill_path
 
-        painter.setPen(QPen(QColor(THEME["accent_primary"]), 2))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawPath(curve_path)
 
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(QColor(THEME["accent_primary"])))
-        for p in points[-5:]:
-            painter.drawEllipse(p, 3, 3)
+# ── Table model ────────────────────────────────────────────────────────────────
 
-        painter.end()
+SIGNAL_BAR_ROLE = Qt.UserRole
+
+
+class WifiTableModel(QAbstractTableModel):
+    """Rows of WifiNetwork objects; cells are computed on demand by the view."""
+
+    HEADERS = ["", "SSID", "BSSID", "Signal", "dBm", "Channel", "Frequency", "Band", "Security"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._networks = []
+        self.connected_bssid = ""
+        self.refresh_theme()
+
+    def refresh_theme(self):
+        """Rebind the theme's colours and fonts; call after the paint cache is cleared."""
+        paint = _paint_objects()
+        self._sig_colors = paint["sig_colors"]
+        self._bold_font = paint["bold_font"]
+        self._connected_bg = paint["connected_bg"]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._networks)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def network(self, row):
+        return self._networks[row]
+
+    def data(self, index, role=Qt.DisplayRole):
+        net = self._networks[index.row()]
+        col = index.column()
+        is_connected = (net.bssid == self.connected_bssid)
+
+        if role == Qt.DisplayRole:
+            if col == 1:
+                return ("📡 " if is_connected else "") + (net.ssid if net.ssid else "<Hidden Network>")
+            if col == 2: return net.bssid
+            if col == 3: return f"{net.signal}%"
+            if col == 4: return f"{net.signal_dbm} dBm"
+            if col == 5: return net.channel
+            if col == 6: return net.frequency
+            if col == 7: return net.band
+            if col == 8: return net.security if net.security else "Open"
+            return None
+        if role == SIGNAL_BAR_ROLE:
+            return net.signal_bar
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.ForegroundRole:
+            if col == 3:
+                return self._sig_colors[net.signal_bucket]
+            if col == 4:
+                return self._sig_colors[net.dbm_bucket]
+            return None
+        if role == Qt.FontRole:
+            if col in (3, 4) or (col == 1 and is_connected):
+                return self._bold_font
+            return None
+        if role == Qt.BackgroundRole:
+            return self._connected_bg if is_connected and col else None
+        return None
+
+    def set_networks(self, networks, connected_bssid):
+        """Diff `networks` against the current rows instead of resetting the model.
+
+        Vanished rows are removed and new ones inserted in contiguous runs, a reorder
+        of the surviving rows is a layout change, and one dataChanged covers the rest,
+        so the view keeps its selection and scroll position across scans.
+        """
+        networks = list(networks)
+        wanted = {net.bssid for net in networks}
+        root = QModelIndex()
+
+        row = len(self._networks)
+        while row > 0:
+            row -= 1
+            if self._networks[row].bssid in wanted:
+                continue
+            end = row
+            while row > 0 and self._networks[row - 1].bssid not in wanted:
+                row -= 1
+            self.beginRemoveRows(root, row, end)
+            del self._networks[row:end + 1]
+            self.endRemoveRows()
+
+        present = {net.bssid for net in self._networks}
+        survivors = [net for net in networks if net.bssid in present]
+        if [net.bssid for net in survivors] != [net.bssid for net in self._networks]:
+            self.layoutAboutToBeChanged.emit()
+            new_row = {net.bssid: i for i, net in enumerate(survivors)}
+            for idx in self.persistentIndexList():
+                moved = new_row[self._networks[idx.row()].bssid]
+                self.changePersistentIndex(idx, self.index(moved, idx.column()))
+            self._networks = survivors
+            self.layoutChanged.emit()
+
+        row = 0
+        while row < len(networks):
+            if networks[row].bssid in present:
+                row += 1
+                continue
+            end = row
+            while end + 1 < len(networks) and networks[end + 1].bssid not in present:
+                end += 1
+            self.beginInsertRows(root, row, end)
+            self._networks[row:row] = networks[row:end + 1]
+            self.endInsertRows()
+            row = end + 1
+
+        self._networks = networks
+        self.connected_bssid = connected_bssid
+        if networks:
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(len(networks) - 1, len(self.HEADERS) - 1))
+
+    def refresh_rows(self, bssids):
+        """Notify the view that the rows of `bssids` changed in place.
+
+        One dataChanged spans the first to the last changed row, so the view
+        invalidates a single rectangle however many rows moved.
+        """
+        rows = [row for row, net in enumerate(self._networks) if net.bssid in bssids]
+        if rows:
+            self.dataChanged.emit(self.index(rows[0], 0),
+                                  self.index(rows[-1], len(self.HEADERS) - 1))
+
+
+class SignalBarDelegate(QStyledItemDelegate):
+    """Paints the signal-bar column straight onto the viewport, no per-row widgets."""
+
+    MARGIN = 6   # px kept clear of the cell border on every side
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        m = self.MARGIN
+        rect = option.rect.adjusted(m, m, -m, -m)
+        pixmap = _signal_bars_pixmap(index.data(SIGNAL_BAR_ROLE), rect.width(), rect.height(),
+                                     painter.device().devicePixelRatioF())
+        painter.drawPixmap(rect.topLeft(), pixmap)
 
 
 # ── Dialogs ────────────────────────────────────────────────────────────────────
@@ -541,11 +966,13 @@ class SettingsDialog(QDialog):
 
 
 class NetworkDetailsDialog(QDialog):
-    def __init__(self, network: WifiNetwork, signal_history=None, scan_interval=3, parent=None):
+    def __init__(self, network: WifiNetwork, signal_history=None, scan_interval=3, parent=None,
+                 animations=True):
         super().__init__(parent)
         self.network = network
         self.signal_history = signal_history or []
         self._scan_interval = scan_interval
+        self._animations = animations
         self.setWindowTitle(f"Network Details - {network.ssid}")
         self.setMinimumSize(800, 400)
         self._build_ui(network)
@@ -570,11 +997,7 @@ class NetworkDetailsDialog(QDialog):
         info_layout = QGridLayout()
         info_layout.setAlignment(Qt.AlignTop)
 
-        sig_val = int(network.signal) if network.signal.isdigit() else 0
-        if sig_val >= 75:   sig_color = THEME["signal_excellent"]
-        elif sig_val >= 50: sig_color = THEME["signal_good"]
-        elif sig_val >= 25: sig_color = THEME["signal_fair"]
-        else:               sig_color = THEME["signal_weak"]
+        sig_color = THEME[SIGNAL_COLOR_KEYS[network.signal_bucket]]
 
         info_items = [
             ("SSID",      network.ssid if network.ssid else "<Hidden>",  None),
@@ -619,7 +1042,7 @@ class NetworkDetailsDialog(QDialog):
         graph_lbl = QLabel("Signal Strength (dBm)")
         graph_lbl.setStyleSheet(f"color: {THEME['text_secondary']}; font-weight: 600;")
         graph_layout.addWidget(graph_lbl)
-        self.graph = SignalGraphWidget(self.signal_history)
+        self.graph = SignalGraphWidget(self.signal_history, animations=self._animations)
         graph_layout.addWidget(self.graph, 1)
 
         splitter.addWidget(info_frame)
@@ -635,6 +1058,223 @@ class NetworkDetailsDialog(QDialog):
 
 # ── Main window ────────────────────────────────────────────────────────────────
 
+# Application stylesheet, one constant per section; {placeholders} are THEME
+# keys. Each section is formatted with format_map and the joined result is
+# cached per theme in _CSS_CACHE.
+
+_BASE_CSS = """
+    QMainWindow {{
+        background-color: {bg_primary};
+    }}
+    QDialog {{
+        background-color: {bg_secondary};
+    }}
+    QWidget {{
+        color: {text_primary}; font-family: 'Segoe UI', Ubuntu, Cantarell, 'Noto Sans', sans-serif;
+    }}
+    QTabWidget > QWidget {{
+        background-color: {bg_secondary};
+    }}
+    QLabel {{ color: {text_primary}; }}
+"""
+
+_INPUT_CSS = """
+    QLineEdit {{
+        background: {bg_tertiary}; color: {text_primary};
+        border: 1px solid {border}; border-radius: 6px; padding: 6px 12px;
+    }}
+    QLineEdit:focus {{ border-color: {accent_primary}; }}
+
+    QSpinBox {{
+        background: {bg_tertiary}; color: {text_primary};
+        border: 1px solid {border}; border-radius: 6px; padding: 5px 8px;
+    }}
+    QSpinBox:focus {{ border-color: {accent_primary}; }}
+    QSpinBox::up-button, QSpinBox::down-button {{
+        background: {bg_card}; border: none; width: 18px;
+    }}
+    QSpinBox::up-arrow {{
+        border-left: 4px solid transparent; border-right: 4px solid transparent;
+        border-bottom: 5px solid {text_secondary};
+    }}
+    QSpinBox::down-arrow {{
+        border-left: 4px solid transparent; border-right: 4px solid transparent;
+        border-top: 5px solid {text_secondary};
+    }}
+
+    QComboBox {{
+        background-color: {bg_tertiary}; color: {text_primary};
+        border: 1px solid {border}; border-radius: 6px;
+        padding: 8px 12px; min-width: 120px;
+    }}
+    QComboBox:hover {{ border-color: {accent_primary}; }}
+    QComboBox::drop-down {{ border: none; width: 30px; }}
+    QComboBox::down-arrow {{
+        image: none;
+        border-left: 5px solid transparent; border-right: 5px solid transparent;
+        border-top: 5px solid {text_secondary}; margin-right: 10px;
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: {bg_secondary}; color: {text_primary};
+        border: 1px solid {border}; border-radius: 6px;
+        selection-background-color: {accent_primary};
+        selection-color: {bg_primary};
+        outline: none;
+    }}
+    QComboBox QAbstractItemView::item {{
+        padding: 6px 12px; min-height: 24px;
+        background-color: {bg_secondary};
+        color: {text_primary};
+    }}
+    QComboBox QAbstractItemView::item:hover {{
+        background-color: {bg_tertiary};
+    }}
+    QComboBox QAbstractItemView::item:selected {{
+        background-color: {accent_primary};
+        color: {bg_primary};
+    }}
+"""
+
+_TABLE_CSS = """
+    QTableView {{
+        background-color: {bg_secondary}; color: {text_primary};
+        border: 1px solid {border}; border-radius: 8px;
+        gridline-color: {border};
+        selection-background-color: {accent_primary};
+        selection-color: {bg_primary};
+    }}
+    QTableView::item {{ padding: 8px; border-bottom: 1px solid {border}; }}
+    QTableView::item:selected {{ background-color: {accent_primary}; }}
+    QHeaderView::section {{
+        background-color: {bg_tertiary}; color: {text_primary};
+        border: none; border-bottom: 2px solid {accent_primary};
+        padding: 10px; font-weight: 600; font-size: 11px; letter-spacing: 1px;
+    }}
+"""
+
+_BUTTON_CSS = """
+    QPushButton {{
+        background: {accent_primary}; color: {bg_primary};
+        border: none; border-radius: 6px; padding: 10px 20px;
+        font-weight: 600; font-size: 12px;
+    }}
+    QPushButton:hover {{ background: {btn_hover}; }}
+    QPushButton:pressed {{ background: {btn_pressed}; }}
+    QPushButton#secondary {{
+        background: {bg_tertiary}; color: {text_primary};
+        border: 1px solid {border};
+    }}
+    QPushButton#secondary:hover {{
+        border-color: {accent_primary}; background: {bg_card};
+    }}
+"""
+
+_CHECKBOX_CSS = """
+    QCheckBox {{ color: {text_secondary}; spacing: 8px; }}
+    QCheckBox::indicator {{
+        width: 18px; height: 18px; border-radius: 4px;
+        border: 2px solid {border}; background: {bg_tertiary};
+    }}
+    QCheckBox::indicator:checked {{
+        background: {accent_primary}; border-color: {accent_primary};
+    }}
+"""
+
+_TAB_CSS = """
+    QTabWidget::pane {{
+        background: {bg_secondary};
+        border: 1px solid {border}; border-radius: 8px;
+    }}
+    QTabWidget > QWidget {{
+        background-color: {bg_secondary};
+    }}
+    QTabBar::tab {{
+        background: {bg_tertiary}; color: {text_secondary};
+        padding: 10px 20px; border: none;
+        border-top-left-radius: 8px; border-top-right-radius: 8px;
+    }}
+    QTabBar::tab:selected {{
+        background: {bg_secondary}; color: {accent_primary};
+    }}
+    QTabBar::tab:hover:!selected {{ background: {bg_card}; }}
+"""
+
+_GROUPBOX_CSS = """
+    QGroupBox {{
+        color: {text_secondary}; border: 1px solid {border};
+        border-radius: 8px; margin-top: 15px; padding-top: 10px;
+        font-size: 11px; letter-spacing: 1px;
+        background: transparent;
+    }}
+    QGroupBox::title {{ subcontrol-origin: margin; left: 15px; padding: 0 8px; }}
+"""
+
+_MENU_CSS = """
+    QMenu {{
+        background-color: {bg_secondary}; color: {text_primary};
+        border: 1px solid {border}; border-radius: 8px; padding: 5px;
+    }}
+    QMenu::item {{ padding: 8px 30px; border-radius: 4px; }}
+    QMenu::item:selected {{
+        background-color: {accent_primary}30; color: {accent_primary};
+    }}
+    QMenu::separator {{ height: 1px; background: {border}; margin: 5px 0; }}
+"""
+
+_SCROLLBAR_CSS = """
+    QScrollBar:vertical {{
+        background: {bg_tertiary}; width: 10px; border-radius: 5px;
+    }}
+    QScrollBar::handle:vertical {{
+        background: {accent_primary}; border-radius: 5px; min-height: 30px;
+    }}
+    QScrollBar::handle:vertical:hover {{ background: {btn_hover}; }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
+"""
+
+_MAIN_WINDOW_CSS = """
+    QLabel#HeaderTitle {{
+        font-size: 24px; font-weight: bold; color: {accent_primary};
+    }}
+    QLabel#WifiCount {{ color: {accent_primary}; font-weight: 600; }}
+    QLabel#AdapterLabel, QLabel#StatusLabel, QLabel#LastScanLabel {{
+        color: {text_secondary};
+    }}
+    QPushButton#HeaderButton {{
+        background: {bg_tertiary}; color: {text_primary};
+        border: none; border-radius: 6px; padding: 8px 16px; font-weight: 600;
+    }}
+    QPushButton#HeaderButton:hover {{ background: {bg_card}; }}
+"""
+
+_SPLITTER_CSS = """
+    QSplitter::handle {{ background: {border}; }}
+"""
+
+_BUTTON_BOX_CSS = """
+    QDialogButtonBox QPushButton {{
+        min-width: 80px; padding: 8px 20px;
+    }}
+"""
+
+_STYLESHEET_SECTIONS = (
+    _BASE_CSS,
+    _INPUT_CSS,
+    _TABLE_CSS,
+    _BUTTON_CSS,
+    _CHECKBOX_CSS,
+    _TAB_CSS,
+    _GROUPBOX_CSS,
+    _MENU_CSS,
+    _SCROLLBAR_CSS,
+    _MAIN_WINDOW_CSS,
+    _SPLITTER_CSS,
+    _BUTTON_BOX_CSS,
+)
+_CSS_CACHE: dict[str, str] = {}
+_ICON_CACHE: dict[int, QIcon] = {}
+
+
 class NZscanMainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -647,8 +1287,13 @@ class NZscanMainWindow(QMainWindow):
 
         self._quitting = False
         self.wifi_networks = []       # full unfiltered list
-        self.signal_history = {}      # bssid -> [dBm, ...]
+        self.signal_history: dict[str, deque[int]] = {}   # bssid -> dBm, newest last
+        self._history_seen = {}       # bssid -> last_seen of its newest sample
         self.connected_bssid = ""
+        self._row_bssids = []         # bssid per rendered table row
+        self._rendered_connected = ""
+        self._details_dialog = None   # open NetworkDetailsDialog, if any
+        self._table_stale = False     # scans arrived while hidden in the tray
 
         apply_theme(self.config.get("theme", "Dark"))
         self._setup_stylesheet()
@@ -665,207 +1310,17 @@ class NZscanMainWindow(QMainWindow):
     # ── Stylesheet ──────────────────────────────────────────────────────────────
 
     def _setup_stylesheet(self):
-        css = f"""
-            QMainWindow {{
-                background-color: {THEME["bg_primary"]};
-            }}
-            QDialog {{
-                background-color: {THEME["bg_secondary"]};
-            }}
-            QWidget {{
-                color: {THEME["text_primary"]}; font-family: 'Segoe UI', Ubuntu, Cantarell, 'Noto Sans', sans-serif;
-            }}
-            QTabWidget > QWidget {{
-                background-color: {THEME["bg_secondary"]};
-            }}
-            QLabel {{ color: {THEME["text_primary"]}; }}
-
-            /* ── Inputs ── */
-            QLineEdit {{
-                background: {THEME["bg_tertiary"]}; color: {THEME["text_primary"]};
-                border: 1px solid {THEME["border"]}; border-radius: 6px; padding: 6px 12px;
-            }}
-            QLineEdit:focus {{ border-color: {THEME["accent_primary"]}; }}
-
-            QSpinBox {{
-                background: {THEME["bg_tertiary"]}; color: {THEME["text_primary"]};
-                border: 1px solid {THEME["border"]}; border-radius: 6px; padding: 5px 8px;
-            }}
-            QSpinBox:focus {{ border-color: {THEME["accent_primary"]}; }}
-            QSpinBox::up-button, QSpinBox::down-button {{
-                background: {THEME["bg_card"]}; border: none; width: 18px;
-            }}
-            QSpinBox::up-arrow {{
-                border-left: 4px solid transparent; border-right: 4px solid transparent;
-                border-bottom: 5px solid {THEME["text_secondary"]};
-            }}
-            QSpinBox::down-arrow {{
-                border-left: 4px solid transparent; border-right: 4px solid transparent;
-                border-top: 5px solid {THEME["text_secondary"]};
-            }}
-
-            QComboBox {{
-                background-color: {THEME["bg_tertiary"]}; color: {THEME["text_primary"]};
-                border: 1px solid {THEME["border"]}; border-radius: 6px;
-                padding: 8px 12px; min-width: 120px;
-            }}
-            QComboBox:hover {{ border-color: {THEME["accent_primary"]}; }}
-            QComboBox::drop-down {{ border: none; width: 30px; }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 5px solid transparent; border-right: 5px solid transparent;
-                border-top: 5px solid {THEME["text_secondary"]}; margin-right: 10px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {THEME["bg_secondary"]}; color: {THEME["text_primary"]};
-                border: 1px solid {THEME["border"]}; border-radius: 6px;
-                selection-background-color: {THEME["accent_primary"]};
-                selection-color: {THEME["bg_primary"]};
-                outline: none;
-            }}
-            QComboBox QAbstractItemView::item {{
-                padding: 6px 12px; min-height: 24px;
-                background-color: {THEME["bg_secondary"]};
-                color: {THEME["text_primary"]};
-            }}
-            QComboBox QAbstractItemView::item:hover {{
-                background-color: {THEME["bg_tertiary"]};
-            }}
-            QComboBox QAbstractItemView::item:selected {{
-                background-color: {THEME["accent_primary"]};
-                color: {THEME["bg_primary"]};
-            }}
-
-            /* ── Table ── */
-            QTableWidget {{
-                background-color: {THEME["bg_secondary"]}; color: {THEME["text_primary"]};
-                border: 1px solid {THEME["border"]}; border-radius: 8px;
-                gridline-color: {THEME["border"]};
-                selection-background-color: {THEME["accent_primary"]};
-                selection-color: {THEME["bg_primary"]};
-            }}
-            QTableWidget::item {{ padding: 8px; border-bottom: 1px solid {THEME["border"]}; }}
-            QTableWidget::item:selected {{ background-color: {THEME["accent_primary"]}; }}
-            QHeaderView::section {{
-                background-color: {THEME["bg_tertiary"]}; color: {THEME["text_primary"]};
-                border: none; border-bottom: 2px solid {THEME["accent_primary"]};
-                padding: 10px; font-weight: 600; font-size: 11px; letter-spacing: 1px;
-            }}
-
-            /* ── Buttons ── */
-            QPushButton {{
-                background: {THEME["accent_primary"]}; color: {THEME["bg_primary"]};
-                border: none; border-radius: 6px; padding: 10px 20px;
-                font-weight: 600; font-size: 12px;
-            }}
-            QPushButton:hover {{ background: {THEME["btn_hover"]}; }}
-            QPushButton:pressed {{ background: {THEME["btn_pressed"]}; }}
-            QPushButton#secondary {{
-                background: {THEME["bg_tertiary"]}; color: {THEME["text_primary"]};
-                border: 1px solid {THEME["border"]};
-            }}
-            QPushButton#secondary:hover {{
-                border-color: {THEME["accent_primary"]}; background: {THEME["bg_card"]};
-            }}
-
-            /* ── Checkboxes ── */
-            QCheckBox {{ color: {THEME["text_secondary"]}; spacing: 8px; }}
-            QCheckBox::indicator {{
-                width: 18px; height: 18px; border-radius: 4px;
-                border: 2px solid {THEME["border"]}; background: {THEME["bg_tertiary"]};
-            }}
-            QCheckBox::indicator:checked {{
-                background: {THEME["accent_primary"]}; border-color: {THEME["accent_primary"]};
-            }}
-
-            /* ── Tabs ── */
-            QTabWidget::pane {{
-                background: {THEME["bg_secondary"]};
-                border: 1px solid {THEME["border"]}; border-radius: 8px;
-            }}
-            QTabWidget > QWidget {{
-                background-color: {THEME["bg_secondary"]};
-            }}
-            QTabBar::tab {{
-                background: {THEME["bg_tertiary"]}; color: {THEME["text_secondary"]};
-                padding: 10px 20px; border: none;
-                border-top-left-radius: 8px; border-top-right-radius: 8px;
-            }}
-            QTabBar::tab:selected {{
-                background: {THEME["bg_secondary"]}; color: {THEME["accent_primary"]};
-            }}
-            QTabBar::tab:hover:!selected {{ background: {THEME["bg_card"]}; }}
-
-            /* ── GroupBox ── */
-            QGroupBox {{
-                color: {THEME["text_secondary"]}; border: 1px solid {THEME["border"]};
-                border-radius: 8px; margin-top: 15px; padding-top: 10px;
-                font-size: 11px; letter-spacing: 1px;
-                background: transparent;
-            }}
-            QGroupBox::title {{ subcontrol-origin: margin; left: 15px; padding: 0 8px; }}
-
-            /* ── Menu ── */
-            QMenu {{
-                background-color: {THEME["bg_secondary"]}; color: {THEME["text_primary"]};
-                border: 1px solid {THEME["border"]}; border-radius: 8px; padding: 5px;
-            }}
-            QMenu::item {{ padding: 8px 30px; border-radius: 4px; }}
-            QMenu::item:selected {{
-                background-color: {THEME["accent_primary"]}30; color: {THEME["accent_primary"]};
-            }}
-            QMenu::separator {{ height: 1px; background: {THEME["border"]}; margin: 5px 0; }}
-
-            /* ── Scrollbar ── */
-            QScrollBar:vertical {{
-                background: {THEME["bg_tertiary"]}; width: 10px; border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {THEME["accent_primary"]}; border-radius: 5px; min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{ background: {THEME["btn_hover"]}; }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
-
-            /* ── Splitter ── */
-            QSplitter::handle {{ background: {THEME["border"]}; }}
-
-            /* ── DialogButtonBox ── */
-            QDialogButtonBox QPushButton {{
-                min-width: 80px; padding: 8px 20px;
-            }}
-        """
-        # Apply to QApplication so all dialogs and top-level widgets are covered
-        QApplication.instance().setStyleSheet(css)
-
-    def _apply_inline_styles(self):
-        """Re-apply per-widget inline stylesheets after a theme change."""
-        self.header_title.setStyleSheet(f"""
-            font-size: 24px; font-weight: bold;
-            color: {THEME["accent_primary"]}; font-family: 'Segoe UI', Ubuntu, Cantarell, 'Noto Sans', sans-serif;
-        """)
-        self.adapter_label.setStyleSheet(f"color: {THEME['text_secondary']};")
-        self.wifi_count.setStyleSheet(f"color: {THEME['accent_primary']}; font-weight: 600;")
-
-        _sec = f"""
-            QPushButton {{
-                background: {THEME["bg_tertiary"]}; color: {THEME["text_primary"]};
-                border: none; border-radius: 6px; padding: 8px 16px; font-weight: 600;
-            }}
-            QPushButton:hover {{ background: {THEME["bg_card"]}; }}
-        """
-        self.settings_btn.setStyleSheet(_sec)
-        self.about_btn.setStyleSheet(_sec)
-
-        self.wifi_filter.setStyleSheet(f"""
-            QLineEdit {{
-                background: {THEME["bg_tertiary"]}; color: {THEME["text_primary"]};
-                border: 1px solid {THEME["border"]}; border-radius: 6px; padding: 6px 12px;
-            }}
-            QLineEdit:focus {{ border-color: {THEME["accent_primary"]}; }}
-        """)
-        self.status_label.setStyleSheet(f"color: {THEME['text_secondary']};")
-        self.last_scan.setStyleSheet(f"color: {THEME['text_secondary']};")
-        self.wifi_table.viewport().update()
+        theme_name = current_theme_name()
+        css = _CSS_CACHE.get(theme_name)
+        if css is None:
+            css = _CSS_CACHE[theme_name] = "\n".join(
+                section.format_map(THEME) for section in _STYLESHEET_SECTIONS
+            )
+        # Apply to QApplication so all dialogs and top-level widgets are covered.
+        # Re-setting an identical sheet would still repolish every widget.
+        app = QApplication.instance()
+        if app.styleSheet() != css:
+            app.setStyleSheet(css)
 
     # ── UI layout ───────────────────────────────────────────────────────────────
 
@@ -890,15 +1345,12 @@ class NZscanMainWindow(QMainWindow):
         layout.addWidget(icon_lbl)
 
         self.header_title = QLabel("NZscan")
-        self.header_title.setStyleSheet(f"""
-            font-size: 24px; font-weight: bold;
-            color: {THEME["accent_primary"]}; font-family: 'Segoe UI', Ubuntu, Cantarell, 'Noto Sans', sans-serif;
-        """)
+        self.header_title.setObjectName("HeaderTitle")
         layout.addWidget(self.header_title)
         layout.addSpacing(20)
 
         self.adapter_label = QLabel("Adapter:")
-        self.adapter_label.setStyleSheet(f"color: {THEME['text_secondary']};")
+        self.adapter_label.setObjectName("AdapterLabel")
         layout.addWidget(self.adapter_label)
 
         self.wifi_adapter = QComboBox()
@@ -916,25 +1368,18 @@ class NZscanMainWindow(QMainWindow):
         layout.addWidget(self.auto_scan)
 
         self.wifi_count = QLabel("0")
-        self.wifi_count.setStyleSheet(f"color: {THEME['accent_primary']}; font-weight: 600;")
+        self.wifi_count.setObjectName("WifiCount")
         layout.addWidget(self.wifi_count)
 
         layout.addStretch()
 
-        _sec_style = f"""
-            QPushButton {{
-                background: {THEME["bg_tertiary"]}; color: {THEME["text_primary"]};
-                border: none; border-radius: 6px; padding: 8px 16px; font-weight: 600;
-            }}
-            QPushButton:hover {{ background: {THEME["bg_card"]}; }}
-        """
         self.settings_btn = QPushButton("Settings")
-        self.settings_btn.setStyleSheet(_sec_style)
+        self.settings_btn.setObjectName("HeaderButton")
         self.settings_btn.clicked.connect(self._open_settings)
         layout.addWidget(self.settings_btn)
 
         self.about_btn = QPushButton("About")
-        self.about_btn.setStyleSheet(_sec_style)
+        self.about_btn.setObjectName("HeaderButton")
         self.about_btn.clicked.connect(self._open_about)
         layout.addWidget(self.about_btn)
 
@@ -950,14 +1395,12 @@ class NZscanMainWindow(QMainWindow):
         self.wifi_filter = QLineEdit()
         self.wifi_filter.setPlaceholderText("Search networks...")
         self.wifi_filter.setClearButtonEnabled(True)
-        self.wifi_filter.setStyleSheet(f"""
-            QLineEdit {{
-                background: {THEME["bg_tertiary"]}; color: {THEME["text_primary"]};
-                border: 1px solid {THEME["border"]}; border-radius: 6px; padding: 6px 12px;
-            }}
-            QLineEdit:focus {{ border-color: {THEME["accent_primary"]}; }}
-        """)
-        self.wifi_filter.textChanged.connect(self._apply_filter)
+        # Coalesce a burst of keystrokes into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(60)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.wifi_filter.textChanged.connect(self._filter_timer.start)
         filter_layout.addWidget(self.wifi_filter)
         filter_layout.addSpacing(10)
 
@@ -971,14 +1414,18 @@ class NZscanMainWindow(QMainWindow):
         self.band_5.stateChanged.connect(self._apply_filter)
         filter_layout.addWidget(self.band_5)
 
+        self.band_6 = QCheckBox("6 GHz")
+        self.band_6.setChecked(True)
+        self.band_6.stateChanged.connect(self._apply_filter)
+        filter_layout.addWidget(self.band_6)
+
         layout.addLayout(filter_layout)
 
         # Table
-        self.wifi_table = QTableWidget()
-        self.wifi_table.setColumnCount(9)
-        self.wifi_table.setHorizontalHeaderLabels(
-            ["", "SSID", "BSSID", "Signal", "dBm", "Channel", "Frequency", "Band", "Security"]
-        )
+        self.wifi_model = WifiTableModel(self)
+        self.wifi_table = QTableView()
+        self.wifi_table.setModel(self.wifi_model)
+        self.wifi_table.setItemDelegateForColumn(0, SignalBarDelegate(self.wifi_table))
         self.wifi_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.wifi_table.setColumnWidth(0, 50)
         self.wifi_table.setColumnWidth(2, 140)
@@ -988,9 +1435,11 @@ class NZscanMainWindow(QMainWindow):
         self.wifi_table.setColumnWidth(6, 90)
         self.wifi_table.setColumnWidth(7, 70)
         self.wifi_table.setColumnWidth(8, 100)
-        self.wifi_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.wifi_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.wifi_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.wifi_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.wifi_table.verticalHeader().setVisible(False)
+        # Cells are single-line; skip the delegate's word-wrap text layout
+        self.wifi_table.setWordWrap(False)
         self.wifi_table.doubleClicked.connect(self._show_details)
         self.wifi_table.horizontalHeader().sectionClicked.connect(self._sort_by_column)
         self._sort_col = -1
@@ -1004,17 +1453,25 @@ class NZscanMainWindow(QMainWindow):
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(0, 10, 0, 0)
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet(f"color: {THEME['text_secondary']};")
+        self.status_label.setObjectName("StatusLabel")
         layout.addWidget(self.status_label)
         layout.addStretch()
         self.last_scan = QLabel("Last scan: Never")
-        self.last_scan.setStyleSheet(f"color: {THEME['text_secondary']};")
+        self.last_scan.setObjectName("LastScanLabel")
         layout.addWidget(self.last_scan)
         return widget
 
     # ── Icon ────────────────────────────────────────────────────────────────────
 
     def _make_icon(self, size=64):
+        # The icon doesn't follow the theme, so each size is painted only once
+        icon = _ICON_CACHE.get(size)
+        if icon is None:
+            icon = _ICON_CACHE[size] = self._paint_icon(size)
+        return icon
+
+    @staticmethod
+    def _paint_icon(size):
         pixmap = QPixmap(size, size)
         pixmap.fill(Qt.transparent)
         painter = QPainter(pixmap)
@@ -1087,33 +1544,34 @@ class NZscanMainWindow(QMainWindow):
             result = subprocess.check_output(
                 ["nmcli", "-t", "-f", "DEVICE,TYPE", "device"], text=True
             )
-            debug(f"nmcli device list:\n{result.strip()}")
+            debug("nmcli device list:\n%s", result.strip())
             for line in result.splitlines():
                 if "wifi" in line.lower() and "p2p" not in line.lower():
                     adapter = line.split(":")[0]
-                    debug(f"Found WiFi adapter: {adapter}")
+                    debug("Found WiFi adapter: %s", adapter)
                     self.wifi_adapter.addItem(adapter)
         except Exception as e:
-            debug(f"Error loading adapters: {e}")
+            debug("Error loading adapters: %s", e)
 
         if self.wifi_adapter.count() == 0:
             debug("No WiFi adapters found")
             self.wifi_adapter.addItem("No adapters")
         else:
-            debug(f"Using adapter: {self.wifi_adapter.currentText()}")
+            debug("Using adapter: %s", self.wifi_adapter.currentText())
 
     def _setup_scanner(self):
         debug("Setting up WiFi scanner...")
         self.wifi_scanner = WifiScannerThread()
         self.wifi_scanner.networks_found.connect(self._on_networks_found)
+        self.wifi_scanner.networks_changed.connect(self._on_networks_changed)
 
         interval_ms = self.config.get("scan_interval", 3) * 1000
-        debug(f"Scan interval: {interval_ms}ms")
+        debug("Scan interval: %dms", interval_ms)
         self.wifi_scanner.set_interval(interval_ms)
 
         adapter = self.wifi_adapter.currentText()
         if adapter and adapter != "No adapters":
-            debug(f"Setting adapter: {adapter}")
+            debug("Setting adapter: %s", adapter)
             self.wifi_scanner.set_adapter(adapter)
 
         if self.auto_scan.isChecked():
@@ -1121,7 +1579,7 @@ class NZscanMainWindow(QMainWindow):
             self._start_scan()
 
     def _on_adapter_changed(self, adapter):
-        debug(f"Adapter changed to: {adapter!r}")
+        debug("Adapter changed to: %r", adapter)
         if adapter and adapter != "No adapters" and hasattr(self, "wifi_scanner"):
             self.wifi_scanner.set_adapter(adapter)
             if self.auto_scan.isChecked():
@@ -1150,7 +1608,7 @@ class NZscanMainWindow(QMainWindow):
     def _manual_scan(self):
         debug("Manual scan triggered")
         adapter = self.wifi_adapter.currentText()
-        debug(f"Adapter: {adapter!r}")
+        debug("Adapter: %r", adapter)
         if adapter and adapter != "No adapters":
             self.wifi_scanner.set_adapter(adapter)
             if not self.wifi_scanner.isRunning():
@@ -1161,37 +1619,77 @@ class NZscanMainWindow(QMainWindow):
 
     # ── Data update ─────────────────────────────────────────────────────────────
 
-    def _get_connected_bssid(self):
-        try:
-            output = subprocess.check_output(
-                ["nmcli", "-t", "-f", "BSSID,ACTIVE", "device", "wifi", "list"],
-                text=True, stderr=subprocess.DEVNULL,
-            )
-            for line in output.strip().split("\n"):
-                unescaped = line.replace("\\:", "\x00")
-                parts = unescaped.split(":")
-                if len(parts) >= 2 and parts[-1].strip() == "yes":
-                    bssid = parts[0].replace("\x00", ":")
-                    debug(f"Connected BSSID: {bssid}")
-                    return bssid
-        except Exception as e:
-            debug(f"[Connected] Error: {e}")
-        return ""
-
-    def _on_networks_found(self, networks):
-        debug(f"Networks received: {len(networks)}")
+    def _on_networks_found(self, networks, connected_bssid):
+        debug("Networks received: %d, connected: %s", len(networks), connected_bssid or "-")
         self.wifi_networks = networks
 
+        dialog_bssid = self._details_dialog.network.bssid if self._details_dialog else None
+        dialog_scanned = False
         for net in networks:
-            if net.bssid not in self.signal_history:
-                self.signal_history[net.bssid] = []
-            self.signal_history[net.bssid].append(net.signal_dbm)
-            if len(self.signal_history[net.bssid]) > 30:
-                self.signal_history[net.bssid] = self.signal_history[net.bssid][-30:]
-
-        self.connected_bssid = self._get_connected_bssid()
+            hist = self.signal_history.get(net.bssid)
+            if hist is None:
+                hist = self.signal_history[net.bssid] = deque(maxlen=SIGNAL_HISTORY_LEN)
+            hist.append(net.signal_dbm)
+            self._history_seen[net.bssid] = net.last_seen
+            if net.bssid == dialog_bssid:
+                dialog_scanned = True
+        self._prune_history(keep=dialog_bssid)
+
+        # The graph no longer repaints on its own, so feed it each new sample,
+        # but only when there is one: set_history restarts the scroll
+        if dialog_scanned:
+            self._details_dialog.graph.set_history(self.signal_history[dialog_bssid])
+
+        self.connected_bssid = connected_bssid
         self.last_scan.setText(f"Last scan: {datetime.now().strftime('%H:%M:%S')}")
+        self.tray.setToolTip(f"NZscan - {len(networks)} networks")
+        if self.connected_bssid != self._rendered_connected:
+            self._render_table()
+        else:
+            # A static scan skips _apply_filter; still replace "Scanning..." etc.
+            self._update_counts()
+
+    def _render_table(self):
+        """Filter into the table now, or once the window is shown again."""
+        if self.isVisible():
+            self._apply_filter()
+        else:
+            self._table_stale = True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._table_stale:
+            self._table_stale = False
+            self._apply_filter()
+            # Rows that survived may still hold values from before the hide
+            self.wifi_model.refresh_rows(set(self._row_bssids))
+
+    def _prune_history(self, keep=None):
+        """Forget the history of BSSIDs that have been out of range for a while.
+
+        `keep` is spared so an open details graph never loses its data.
+        """
+        window = self.config.get("scan_interval", 3) * HISTORY_STALE_SCANS
+        cutoff = datetime.now() - timedelta(seconds=window)
+        stale = [bssid for bssid, seen in self._history_seen.items()
+                 if seen < cutoff and bssid != keep]
+        for bssid in stale:
+            del self._history_seen[bssid]
+            self.signal_history.pop(bssid, None)
+        if stale:
+            debug("Pruned history of %d stale networks", len(stale))
+
+    def _on_networks_changed(self, added, updated, removed):
+        debug("Networks changed: +%d ~%d -%d", len(added), len(updated), len(removed))
+        if not self.isVisible():
+            self._table_stale = True
+            return
+        if not (added or removed) and self._patch_rows(updated):
+            return
         self._apply_filter()
+        # _apply_filter leaves the model alone when the rows are unchanged
+        if updated:
+            self.wifi_model.refresh_rows({net.bssid for net in updated})
 
     # ── Sorting ─────────────────────────────────────────────────────────────────
 
@@ -1207,10 +1705,10 @@ class NZscanMainWindow(QMainWindow):
         sort_keys = {
             1: lambda n: (n.ssid or "").lower(),
             2: lambda n: n.bssid,
-            3: lambda n: int(n.signal) if n.signal.isdigit() else 0,
+            3: lambda n: n.signal_int,
             4: lambda n: n.signal_dbm,
-            5: lambda n: int(n.channel) if n.channel.isdigit() else 0,
-            6: lambda n: n.frequency,
+            5: lambda n: n.channel_int,
+            6: lambda n: n.freq_mhz,
             7: lambda n: n.band,
             8: lambda n: n.security or "",
         }
@@ -1221,10 +1719,11 @@ class NZscanMainWindow(QMainWindow):
 
     # ── Filter & render ─────────────────────────────────────────────────────────
 
-    def _apply_filter(self, *_):
+    def _filter_networks(self):
         search = self.wifi_filter.text().strip().lower()
         show_24 = self.band_24.isChecked()
         show_5  = self.band_5.isChecked()
+        show_6  = self.band_6.isChecked()
 
         filtered = []
         for net in self.wifi_networks:
@@ -1232,94 +1731,66 @@ class NZscanMainWindow(QMainWindow):
                 continue
             if net.band == "5 GHz" and not show_5:
                 continue
-            if search:
-                haystack = f"{net.ssid} {net.bssid} {net.security}".lower()
-                if search not in haystack:
-                    continue
+            if net.band == "6 GHz" and not show_6:
+                continue
+            if search and search not in net.search_text:
+                continue
             filtered.append(net)
+        return filtered
 
-        debug(f"Filter: showing {len(filtered)}/{len(self.wifi_networks)} networks")
-
-        self.wifi_table.setRowCount(0)
-        connected_bg = QColor(THEME["accent_primary"])
-        connected_bg.setAlpha(25)
-
-        for row, net in enumerate(filtered):
-            self.wifi_table.insertRow(row)
-            is_connected = (net.bssid == self.connected_bssid)
-
-            sig_widget = SignalStrengthWidget(net.signal_bar)
-            self.wifi_table.setCellWidget(row, 0, sig_widget)
-
-            items = [
-                ("📡 " if is_connected else "") + (net.ssid if net.ssid else "<Hidden Network>"),
-                net.bssid,
-                f"{net.signal}%",
-                f"{net.signal_dbm} dBm",
-                net.channel,
-                net.frequency,
-                net.band,
-                net.security if net.security else "Open",
-            ]
-            for col, val in enumerate(items, 1):
-                item = QTableWidgetItem(val)
-                item.setTextAlignment(Qt.AlignCenter)
-                if is_connected:
-                    item.setBackground(connected_bg)
-                    if col == 1:
-                        f = QFont(); f.setBold(True); item.setFont(f)
-                if col == 3:
-                    sig = int(net.signal) if net.signal.isdigit() else 0
-                    if sig >= 75:   c = THEME["signal_excellent"]
-                    elif sig >= 50: c = THEME["signal_good"]
-                    elif sig >= 25: c = THEME["signal_fair"]
-                    else:           c = THEME["signal_weak"]
-                    item.setForeground(QColor(c))
-                    f = QFont(); f.setBold(True); item.setFont(f)
-                if col == 4:
-                    dbm = net.signal_dbm
-                    if dbm >= -50:   c = THEME["signal_excellent"]
-                    elif dbm >= -70: c = THEME["signal_good"]
-                    elif dbm >= -80: c = THEME["signal_fair"]
-                    else:            c = THEME["signal_weak"]
-                    item.setForeground(QColor(c))
-                    f = QFont(); f.setBold(True); item.setFont(f)
-                self.wifi_table.setItem(row, col, item)
-
-        self.wifi_count.setText(f"{len(filtered)}/{len(self.wifi_networks)}")
-        self.status_label.setText(
-            f"Showing {len(filtered)} of {len(self.wifi_networks)} networks"
-        )
+    def _apply_filter(self, *_):
+        filtered = self._filter_networks()
+        debug("Filter: showing %d/%d networks", len(filtered), len(self.wifi_networks))
+
+        # Row values are kept fresh by _patch_rows, so only the row layout and the
+        # connected highlight can make the rendered table stale
+        row_bssids = [net.bssid for net in filtered]
+        if row_bssids != self._row_bssids or self.connected_bssid != self._rendered_connected:
+            self.wifi_model.set_networks(filtered, self.connected_bssid)
+            self._row_bssids = row_bssids
+            self._rendered_connected = self.connected_bssid
+        self._update_counts()
+
+    def _update_counts(self):
+        shown, total = len(self._row_bssids), len(self.wifi_networks)
+        self.wifi_count.setText(f"{shown}/{total}")
+        self.status_label.setText(f"Showing {shown} of {total} networks")
+
+    def _patch_rows(self, updated):
+        """Refresh only the rows of `updated`; False if the row layout changed."""
+        if self.connected_bssid != self._rendered_connected:
+            return False
+        filtered = self._filter_networks()
+        if [net.bssid for net in filtered] != self._row_bssids:
+            return False
+
+        changed = {net.bssid for net in updated}
+        self.wifi_model.refresh_rows(changed)
+        debug("Patched %d rows in place", len(changed))
+        return True
 
     # ── Details dialog ──────────────────────────────────────────────────────────
 
     def _show_details(self):
-        row = self.wifi_table.currentRow()
-        # Map table row back to filtered list to get correct network
-        search   = self.wifi_filter.text().strip().lower()
-        show_24  = self.band_24.isChecked()
-        show_5   = self.band_5.isChecked()
-        filtered = []
-        for net in self.wifi_networks:
-            if net.band == "2.4 GHz" and not show_24: continue
-            if net.band == "5 GHz"   and not show_5:  continue
-            if search:
-                if search not in f"{net.ssid} {net.bssid} {net.security}".lower(): continue
-            filtered.append(net)
-
-        if 0 <= row < len(filtered):
-            network = filtered[row]
-            debug(f"Opening details for: {network.ssid!r} ({network.bssid})")
+        row = self.wifi_table.currentIndex().row()
+        # The model holds exactly the filtered rows, in display order
+        if 0 <= row < self.wifi_model.rowCount():
+            network = self.wifi_model.network(row)
+            debug("Opening details for: %r (%s)", network.ssid, network.bssid)
             history  = self.signal_history.get(network.bssid, [])
             interval = self.config.get("scan_interval", 3)
-            dialog   = NetworkDetailsDialog(network, history, interval, self)
-            if dialog.exec():
+            dialog   = NetworkDetailsDialog(network, history, interval, self,
+                                            animations=self.config.get("animations", True))
+            self._details_dialog = dialog
+            accepted = dialog.exec()
+            self._details_dialog = None
+            if accepted:
                 new_interval = dialog.interval_spin.value()
                 if new_interval != interval:
                     self.config["scan_interval"] = new_interval
                     save_config(self.config)
                     self.wifi_scanner.set_interval(new_interval * 1000)
-                    debug(f"Scan interval updated to {new_interval}s")
+                    debug("Scan interval updated to %ds", new_interval)
 
     # ── Settings & About ────────────────────────────────────────────────────────
 
@@ -1327,10 +1798,11 @@ class NZscanMainWindow(QMainWindow):
         """Apply the theme stored in config to all UI elements."""
         theme_name = self.config.get("theme", "Dark")
         apply_theme(theme_name)
-        debug(f"Applying theme: {theme_name}")
+        _paint_cache.clear()
+        self.wifi_model.refresh_theme()
+        debug("Applying theme: %s", theme_name)
         self._setup_stylesheet()
-        self._apply_inline_styles()
-        self._apply_filter()   # re-render table rows with new signal colours
+        self.wifi_table.viewport().update()   # repaint rows with the new signal colours
 
     def _open_settings(self):
         dialog = SettingsDialog(self)
@@ -1338,7 +1810,7 @@ class NZscanMainWindow(QMainWindow):
             self.config = load_config()
             interval_ms = self.config.get("scan_interval", 3) * 1000
             self.wifi_scanner.set_interval(interval_ms)
-            debug(f"Settings saved, interval={interval_ms}ms")
+            debug("Settings saved, interval=%dms", interval_ms)
             self._apply_theme_change()
 
     def _open_about(self):
@@ -1412,6 +1884,11 @@ class NZscanMainWindow(QMainWindow):
 # ── Entry point ────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG if DEBUG else logging.WARNING,
+        format="[%(levelname)s] [%(asctime)s] %(message)s",
+        datefmt="%H:%M:%S",
+    )
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
     window = NZscanMainWindow()
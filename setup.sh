@@ -92,23 +92,23 @@ install_system_deps() {
         apt)
             sudo apt-get update -q
             sudo apt-get install -y python3 python3-pip python3-venv \
-                network-manager
+                network-manager python3-gi gir1.2-nm-1.0
             ;;
         dnf)
             sudo dnf install -y python3 python3-pip \
-                NetworkManager
+                NetworkManager NetworkManager-libnm python3-gobject
             ;;
         pacman)
             sudo pacman -Sy --noconfirm --needed python python-pip \
-                networkmanager
+                networkmanager python-gobject
             ;;
         zypper)
             sudo zypper install -y python3 python3-pip \
-                NetworkManager
+                NetworkManager python3-gobject typelib-1_0-NM-1_0
             ;;
         xbps)
             sudo xbps-install -y python3 python3-pip \
-                NetworkManager
+                NetworkManager python3-gobject
             ;;
         unknown)
             warn "Cannot detect package manager for '${DISTRO}'."